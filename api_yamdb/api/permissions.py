@@ -5,15 +5,13 @@ class IsAdminOnly(permissions.BasePermission):
     def has_permission(self, request, view):
         return (
             request.user.is_authenticated
-            and (request.user.is_superuser
-                 or request.user.is_admin)
+            and request.user.is_admin
         )
 
     def has_object_permission(self, request, view, obj):
         return (
             request.user.is_authenticated
-            and (request.user.is_superuser
-                 or request.user.is_admin)
+            and request.user.is_admin
         )
 
 
@@ -25,8 +23,8 @@ class IsAdminOrReadOnly(permissions.BasePermission):
     """
     def has_permission(self, request, view):
         return (request.method in permissions.SAFE_METHODS
-                or (request.user.is_authenticated and (
-                    request.user.is_admin or request.user.is_superuser)))
+                or (request.user.is_authenticated
+                    and request.user.is_admin))
 
 
 class IsAuthorModeratorAdminOrReadOnly(permissions.BasePermission):
@@ -44,7 +42,6 @@ class IsAuthorModeratorAdminOrReadOnly(permissions.BasePermission):
             or obj.author == request.user
             or request.user.is_admin
             or request.user.is_moderator
-            or request.user.is_superuser
         )
 
     def has_permission(self, request, view):
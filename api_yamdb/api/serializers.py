@@ -1,6 +1,7 @@
 from rest_framework import serializers
 from reviews.models import Category, Comment, Genre, Review, Title
 from users.models import User
+from users.validators import username_validation
 
 
 class UserSerializer(serializers.ModelSerializer):
@@ -28,6 +29,10 @@ class SignupSerializer(serializers.ModelSerializer):
             'username',
             'email'
         )
+        extra_kwargs = {
+            'username': {'validators': (username_validation,)},
+            'email': {'validators': ()},
+        }
 
 
 class TokenSerializer(serializers.ModelSerializer):
@@ -63,10 +68,7 @@ class TitleSerializer(serializers.ModelSerializer):
     genre = serializers.SlugRelatedField(
         slug_field='slug', many=True, queryset=Genre.objects.all()
     )
-    rating = serializers.IntegerField(
-        source='reviews__score__avg',
-        read_only=True
-    )
+    rating = serializers.IntegerField(read_only=True)
 
     class Meta:
         model = Title
@@ -76,25 +78,23 @@ class TitleSerializer(serializers.ModelSerializer):
 class GetTitleSerializer(serializers.ModelSerializer):
     category = CategorySerializer(read_only=True)
     genre = GenreSerializer(read_only=True, many=True)
-    rating = serializers.IntegerField(
-        source='reviews__score__avg',
-        read_only=True
-    )
+    rating = serializers.IntegerField(read_only=True)
 
     class Meta:
         model = Title
         fields = '__all__'
 
+    @staticmethod
+    def setup_eager_loading(queryset):
+        """Подгружает связанные категорию и жанры одним запросом."""
+        return queryset.select_related('category').prefetch_related('genre')
+
 
 class ReviewSerializer(serializers.ModelSerializer):
     """Сериализатор для модели ревью."""
 
     author = serializers.StringRelatedField(read_only=True)
-    title = serializers.SlugRelatedField(
-        slug_field='id',
-        many=False,
-        read_only=True,
-    )
+    title = serializers.IntegerField(source='title_id', read_only=True)
 
     class Meta:
         model = Review
@@ -107,27 +107,6 @@ class ReviewSerializer(serializers.ModelSerializer):
             'title',
         )
 
-    def validate(self, data):
-        """Запрещает пользователям оставлять повторные отзывы"""
-        if not self.context.get('request').method == 'POST':
-            return data
-        author = self.context.get('request').user
-        title_id = self.context.get('view').kwargs.get('title_id')
-        if Review.objects.filter(author=author, title=title_id).exists():
-            raise serializers.ValidationError(
-                'Вы уже оставляли отзыв на это произведение',
-            )
-        return data
-
-    @staticmethod
-    def validate_score(value):
-        """Проверка, что оценка в диапазоне от 1 до 10."""
-        if not 1 <= value <= 10:
-            raise serializers.ValidationError(
-                'Оценка может быть только от 1 до 10'
-            )
-        return value
-
 
 class CommentSerializer(serializers.ModelSerializer):
     """Сериализатор для модели комментария."""
@@ -1,18 +1,22 @@
+from django.contrib.auth.hashers import make_password
 from django.contrib.auth.tokens import default_token_generator
-from django.core.mail import send_mail
+from django.core.cache import cache
+from django.db import IntegrityError, transaction
 from django.db.models import Avg
-from django.http import HttpResponseBadRequest
+from django.http import Http404, HttpResponseBadRequest
 from django.shortcuts import get_object_or_404
 from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework import filters, mixins, status, views, viewsets
 from rest_framework.decorators import action
+from rest_framework.exceptions import ValidationError
 from rest_framework.filters import SearchFilter
 from rest_framework.permissions import (AllowAny, IsAuthenticated,
                                         IsAuthenticatedOrReadOnly)
 from rest_framework.response import Response
-from rest_framework_simplejwt.tokens import RefreshToken
-from reviews.models import Category, Comment, Genre, Review, Title
+from rest_framework_simplejwt.tokens import AccessToken
+from reviews.models import Category, Genre, Review, Title
 from users.models import User
+from users.tasks import queue_confirmation_email
 
 from .filters import TitlesFilter
 from .permissions import (IsAdminOnly, IsAdminOrReadOnly,
@@ -26,11 +30,48 @@ from .serializers import (CategorySerializer, CommentSerializer,
 class ListCreateDestroyViewSet(mixins.ListModelMixin, mixins.CreateModelMixin,
                                mixins.DestroyModelMixin,
                                viewsets.GenericViewSet):
-    pass
+    """
+    Вьюсет для справочников со слагом. Список кэшируется, кэш
+    сбрасывается при создании и удалении объектов.
+    """
+    cache_timeout = 300
+
+    def get_cache_version_key(self):
+        return f'{self.basename}_list_version'
+
+    def invalidate_list_cache(self):
+        try:
+            cache.incr(self.get_cache_version_key())
+        except ValueError:
+            cache.set(self.get_cache_version_key(), 1, timeout=None)
+
+    def list(self, request, *args, **kwargs):
+        version = cache.get_or_set(
+            self.get_cache_version_key(), 1, timeout=None)
+        cache_key = f'{self.basename}_list_{request.build_absolute_uri()}'
+        data = cache.get(cache_key, version=version)
+        if data is None:
+            queryset = self.filter_queryset(
+                self.get_queryset()).values(*self.get_serializer().fields)
+            page = self.paginate_queryset(queryset)
+            if page is not None:
+                data = self.get_paginated_response(page).data
+            else:
+                data = list(queryset)
+            cache.set(cache_key, data, self.cache_timeout, version=version)
+        return Response(data)
+
+    def perform_create(self, serializer):
+        super().perform_create(serializer)
+        self.invalidate_list_cache()
+
+    def perform_destroy(self, instance):
+        super().perform_destroy(instance)
+        self.invalidate_list_cache()
 
 
 class UserViewSet(viewsets.ModelViewSet):
-    queryset = User.objects.all()
+    queryset = User.objects.only(*UserSerializer.Meta.fields)
     serializer_class = UserSerializer
     permission_classes = (IsAuthenticated, IsAdminOnly, )
     lookup_field = 'username'
@@ -44,52 +85,47 @@ class UserViewSet(viewsets.ModelViewSet):
         permission_classes=(IsAuthenticated,),
         url_path='me')
     def get_user_info(self, request):
-        serializer = UserSerializer(request.user)
-        if request.method == 'PATCH':
-            if request.user.is_admin:
-                serializer = UserSerializer(
-                    request.user,
-                    data=request.data,
-                    partial=True)
-            else:
-                serializer = ReadOnlyRole(
-                    request.user,
-                    data=request.data,
-                    partial=True)
-            serializer.is_valid(raise_exception=True)
-            serializer.save()
-            return Response(serializer.data, status=status.HTTP_200_OK)
-        return Response(serializer.data)
+        if request.method == 'GET':
+            return Response(UserSerializer(request.user).data)
+        serializer_class = (
+            UserSerializer if request.user.is_admin else ReadOnlyRole
+        )
+        serializer = serializer_class(
+            request.user,
+            data=request.data,
+            partial=True)
+        serializer.is_valid(raise_exception=True)
+        serializer.save()
+        return Response(serializer.data, status=status.HTTP_200_OK)
 
 
 class SignupView(views.APIView):
     permission_classes = (AllowAny,)
 
     def post(self, request):
-        username_and_email_exists = User.objects.filter(
-            username=request.data.get("username"),
-            email=request.data.get("email"),
-        ).exists()
-        if username_and_email_exists:
-            return Response(request.data, status=status.HTTP_200_OK)
         serializer = SignupSerializer(data=request.data)
         serializer.is_valid(raise_exception=True)
-        user = User.objects.create_user(
-            username=serializer.data.get('username'),
-            email=serializer.data.get('email'),
-        )
-        confirmation_code = default_token_generator.make_token(user)
-        email_message = (
-            f'Привет, {user.username}!'
-            f'Твой код подтверждения: {confirmation_code}'
-        )
-        send_mail(
-            subject='Confirmation code for YaMDb',
-            message=email_message,
-            from_email=None,
-            recipient_list=[user.email],
-            fail_silently=False,
-        )
+        credentials = {
+            'username': User.normalize_username(
+                serializer.validated_data['username']),
+            'email': User.objects.normalize_email(
+                serializer.validated_data['email']),
+        }
+        try:
+            user, _ = User.objects.get_or_create(
+                **credentials,
+                defaults={'password': make_password(None)},
+            )
+        except IntegrityError:
+            errors = {
+                field: [f'Пользователь с таким {field} уже существует.']
+                for field, value in credentials.items()
+                if User.objects.filter(**{field: value}).exists()
+            }
+            if not errors:
+                raise
+            raise ValidationError(errors)
+        queue_confirmation_email(user.id)
         return Response(serializer.data, status=status.HTTP_200_OK)
 
 
@@ -103,7 +139,7 @@ class GetTokenView(views.APIView):
         confirmation_code = data['confirmation_code']
         if not default_token_generator.check_token(user, confirmation_code):
             return HttpResponseBadRequest('Неверный код подтверждения')
-        token = RefreshToken.for_user(user).access_token
+        token = AccessToken.for_user(user)
         return Response(
             {'token': str(token)}, status=status.HTTP_200_OK)
 
@@ -128,12 +164,19 @@ class GenreViewSet(ListCreateDestroyViewSet):
 
 class TitleViewSet(viewsets.ModelViewSet):
     queryset = Title.objects.all().annotate(
-        Avg('reviews__score')).order_by('name')
+        rating=Avg('reviews__score')).order_by('name')
     serializer_class = TitleSerializer
     permission_classes = (IsAdminOrReadOnly,)
     filterset_class = TitlesFilter
     filter_backends = (DjangoFilterBackend,)
 
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        serializer_class = self.get_serializer_class()
+        if hasattr(serializer_class, 'setup_eager_loading'):
+            return serializer_class.setup_eager_loading(queryset)
+        return queryset
+
     def get_serializer_class(self):
         if self.action in ('list', 'retrieve'):
             return GetTitleSerializer
@@ -150,14 +193,32 @@ class ReviewViewSet(viewsets.ModelViewSet):
     )
 
     def perform_create(self, serializer):
+        title_id = self.get_title_id()
+        try:
+            with transaction.atomic():
+                serializer.save(author=self.request.user, title_id=title_id)
+        except IntegrityError:
+            already_reviewed = Review.objects.filter(
+                author=self.request.user, title_id=title_id).exists()
+            if not already_reviewed:
+                raise
+            raise ValidationError({
+                'non_field_errors': [
+                    'Вы уже оставляли отзыв на это произведение'
+                ],
+            })
+
+    def get_title_id(self):
+        """Проверяет, что тайтл существует, и возвращает его id."""
         title_id = self.kwargs.get('title_id')
-        title = get_object_or_404(Title, id=title_id)
-        serializer.save(author=self.request.user, title=title)
+        if not Title.objects.filter(id=title_id).exists():
+            raise Http404
+        return title_id
 
     def get_queryset(self):
-        title_id = self.kwargs.get('title_id')
-        title = get_object_or_404(Title, id=title_id)
-        return title.reviews.all()
+        return Review.objects.filter(
+            title_id=self.get_title_id()
+        ).select_related('author')
 
 
 class CommentViewSet(viewsets.ModelViewSet):
@@ -169,18 +230,18 @@ class CommentViewSet(viewsets.ModelViewSet):
         IsAuthorModeratorAdminOrReadOnly,
     )
 
+    def get_review(self):
+        """Получение ревью одним запросом по id ревью и id тайтла."""
+        return get_object_or_404(
+            Review,
+            id=self.kwargs.get('review_id'),
+            title_id=self.kwargs.get('title_id'),
+        )
+
     def perform_create(self, serializer):
         """Создание нового коммента."""
-        title_id = self.kwargs.get('title_id')
-        title = get_object_or_404(Title, id=title_id)
-        review_id = self.kwargs.get('review_id')
-        review = get_object_or_404(Review, id=review_id, title=title)
-        serializer.save(author=self.request.user, review=review)
+        serializer.save(author=self.request.user, review=self.get_review())
 
     def get_queryset(self):
         """Получение кверисета."""
-        title_id = self.kwargs.get('title_id')
-        title = get_object_or_404(Title, id=title_id)
-        review_id = self.kwargs.get('review_id')
-        review = get_object_or_404(Review, id=review_id, title=title)
-        return Comment.objects.filter(review=review)
+        return self.get_review().comments.select_related('author')
@@ -0,0 +1,17 @@
+# Generated by Django 3.2 on 2026-10-15 10:21
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reviews', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.RemoveField(
+            model_name='title',
+            name='rating',
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 3.2 on 2026-10-15 10:25
+
+import django.core.validators
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reviews', '0002_remove_title_rating'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='review',
+            name='score',
+            field=models.PositiveSmallIntegerField(validators=[django.core.validators.MinValueValidator(1, message='Оценка не может быть ниже'), django.core.validators.MaxValueValidator(10, message='Оценка не может быть выше')], verbose_name='Оценка'),
+        ),
+        migrations.AddConstraint(
+            model_name='review',
+            constraint=models.CheckConstraint(check=models.Q(('score__gte', 1), ('score__lte', 10)), name='score_range'),
+        ),
+    ]
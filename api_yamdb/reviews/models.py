@@ -64,11 +64,6 @@ class Title(models.Model):
     genre = models.ManyToManyField(
         Genre, through='GenreTitle'
     )
-    rating = models.IntegerField(
-        verbose_name='Рейтинг',
-        null=True,
-        default=None
-    )
 
     def __str__(self):
         return self.name
@@ -98,7 +93,7 @@ class Review(models.Model):
         related_name='reviews',
         verbose_name='Автор',
     )
-    score = models.PositiveIntegerField(
+    score = models.PositiveSmallIntegerField(
         verbose_name='Оценка',
         validators=(
             MinValueValidator(
@@ -131,6 +126,10 @@ class Review(models.Model):
                 fields=('author', 'title'),
                 name='unique_review',
             ),
+            models.CheckConstraint(
+                check=models.Q(score__gte=1) & models.Q(score__lte=10),
+                name='score_range',
+            ),
         )
 
     def __str__(self):
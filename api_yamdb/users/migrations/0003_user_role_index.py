@@ -0,0 +1,17 @@
+# Generated by Django 3.2 on 2026-10-15 10:25
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0002_auto_20230222_1553'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='user',
+            index=models.Index(fields=['role'], name='users_role_idx'),
+        ),
+    ]
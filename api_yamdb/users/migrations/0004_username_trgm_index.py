@@ -0,0 +1,36 @@
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations
+
+# SearchFilter (icontains) generates
+# UPPER("users_user"."username"::text) LIKE UPPER('%term%'),
+# so the index is built on the same expression.
+CREATE_INDEX_SQL = (
+    'CREATE INDEX users_username_trgm_idx ON users_user '
+    'USING gin (UPPER(username::text) gin_trgm_ops)'
+)
+DROP_INDEX_SQL = 'DROP INDEX IF EXISTS users_username_trgm_idx'
+
+
+def create_username_trgm_index(apps, schema_editor):
+    if schema_editor.connection.vendor == 'postgresql':
+        schema_editor.execute(CREATE_INDEX_SQL)
+
+
+def drop_username_trgm_index(apps, schema_editor):
+    if schema_editor.connection.vendor == 'postgresql':
+        schema_editor.execute(DROP_INDEX_SQL)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0003_user_role_index'),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.RunPython(
+            create_username_trgm_index,
+            drop_username_trgm_index,
+        ),
+    ]
@@ -1,5 +1,6 @@
 from django.contrib.auth.models import AbstractUser
 from django.db import models
+from django.utils.functional import cached_property
 
 from .validators import username_validation
 
@@ -62,11 +63,14 @@ class User(AbstractUser):
         ordering = ('id',)
         verbose_name = 'Пользователь'
         verbose_name_plural = 'Пользователи'
+        indexes = (
+            models.Index(fields=('role',), name='users_role_idx'),
+        )
 
     def __str__(self):
         return self.username
 
-    @property
+    @cached_property
     def is_admin(self):
         return self.role == self.ADMIN or self.is_superuser
 
@@ -0,0 +1,35 @@
+from celery import shared_task
+from django.contrib.auth.tokens import default_token_generator
+from django.core.mail import send_mail
+from kombu.exceptions import OperationalError
+
+from .models import User
+
+
+@shared_task
+def send_confirmation_email(user_id):
+    """Отправляет пользователю код подтверждения."""
+    user = User.objects.get(id=user_id)
+    confirmation_code = default_token_generator.make_token(user)
+    email_message = (
+        f'Привет, {user.username}!'
+        f'Твой код подтверждения: {confirmation_code}'
+    )
+    send_mail(
+        subject='Confirmation code for YaMDb',
+        message=email_message,
+        from_email=None,
+        recipient_list=[user.email],
+        fail_silently=False,
+    )
+
+
+def queue_confirmation_email(user_id):
+    """
+    Ставит отправку кода в очередь. Если брокер недоступен,
+    отправляет письмо синхронно.
+    """
+    try:
+        send_confirmation_email.delay(user_id)
+    except OperationalError:
+        send_confirmation_email(user_id)